@@ -441,7 +441,7 @@ if __name__ == '__main__':
     string2='DCBA'  # littleendian
 
     s1 = 'the quick brown fox jumped over the lazy dog'
-    s2 = s1.encode('zlib')
+    s2 = zlib.compress(s1)
 
     @TestCase
     def test_dynamic_union_rootstatic():
@@ -187,6 +187,7 @@ class _parray_generic(ptype.container):
         """Calls .repr() to display the details of a specific object"""
         prop = ','.join('{:s}={!r}'.format(k,v) for k,v in self.properties().iteritems())
         result = self.repr()
+        classname,name = self.classname(),self.name()
 
         # generate the element description
         length = len(self) if self.initializedQ() else (self.length or 0)
@@ -197,17 +198,19 @@ class _parray_generic(ptype.container):
         element_descr = '{:s}[{:d}]'.format(obj, length)
 
         # multiline
-        if result.count('\n') > 0:
+        if '\n' in result:
             if prop:
-                return "{:s} '{:s}' {{{:s}}} {:s}\n{:s}".format(utils.repr_class(self.classname()),self.name(),prop,element_descr,result)
-            return "{:s} '{:s}' {:s}\n{:s}".format(utils.repr_class(self.classname()),self.name(),element_descr,result)
+                return "{:s} '{:s}' {{{:s}}} {:s}\n{:s}".format(utils.repr_class(classname),name,prop,element_descr,result)
+            return "{:s} '{:s}' {:s}\n{:s}".format(utils.repr_class(classname),name,element_descr,result)
 
-        _hex,_precision = Config.pbinary.offset == config.partial.hex, 3 if Config.pbinary.offset == config.partial.fractional else 0
+        offset = Config.pbinary.offset
+        _hex,_precision = offset == config.partial.hex, 3 if offset == config.partial.fractional else 0
         # single-line
-        descr = "{:s} '{:s}'".format(utils.repr_class(self.classname()), self.name()) if self.value is None else utils.repr_instance(self.classname(),self.name())
+        position = utils.repr_position(self.getposition(), hex=_hex, precision=_precision)
+        descr = "{:s} '{:s}'".format(utils.repr_class(classname), name) if self.value is None else utils.repr_instance(classname,name)
         if prop:
-            return "[{:s}] {:s} {{{:s}}} {:s} {:s}".format(utils.repr_position(self.getposition(), hex=_hex, precision=_precision), descr, prop, element_descr, result)
-        return "[{:s}] {:s} {:s} {:s}".format(utils.repr_position(self.getposition(), hex=_hex, precision=_precision), descr, element_descr, result)
+            return "[{:s}] {:s} {{{:s}}} {:s} {:s}".format(position, descr, prop, element_descr, result)
+        return "[{:s}] {:s} {:s} {:s}".format(position, descr, element_descr, result)
 
 class type(_parray_generic):
     '''
@@ -225,9 +228,11 @@ class type(_parray_generic):
     # load ourselves lazily
     def __load_block(self, **attrs):
         ofs = self.getoffset()
+
+        new,append = self.new,self.value.append
         for index in xrange(self.length):
-            n = self.new(self._object_, __name__=str(index), offset=ofs, **attrs)
-            self.value.append(n)
+            n = new(self._object_, __name__=str(index), offset=ofs, **attrs)
+            append(n)
             ofs += n.blocksize()
         return self
 
@@ -114,7 +114,7 @@ Example usage:
     instance.load()
 """
 
-import types,inspect,itertools,operator,six
+import types,inspect,itertools,operator,six,__builtin__
 import ptype,utils,bitmap,config,error
 Config = config.defaults
 Log = Config.log.getChild(__name__[len(__package__)+1:])
@@ -137,13 +137,11 @@ def setbyteorder(endianness):
     raise ValueError("Unknown integer endianness {!r}".format(endianness))
 
 # instance tests
-@utils.memoize('t')
 def istype(t):
-    return t.__class__ is t.__class__.__class__ and not ptype.isresolveable(t) and (isinstance(t, types.ClassType) or hasattr(object, '__bases__')) and issubclass(t, type)
+    return isinstance(t, __builtin__.type) and issubclass(t, type)
 
-@utils.memoize('t')
 def iscontainer(t):
-    return istype(t) and issubclass(t, container)
+    return isinstance(t, __builtin__.type) and issubclass(t, container)
 
 def force(t, self, chain=None):
     """Resolve type ``t`` into a pbinary.type for the provided object ``self``"""
@@ -135,7 +135,7 @@ Example usage of pint.enum:
     # return the instance as a name or an integer in string form
     print instance.str()
 """
-import six
+import six,struct
 from . import ptype,bitmap,config,error,utils
 Config = config.defaults
 Log = Config.log.getChild(__name__[len(__package__)+1:])
@@ -174,6 +174,9 @@ def littleendian(ptype):
     d['byteorder'] = config.byteorder.littleendian
     return __builtin__.type(ptype.__name__, ptype.__bases__, d)
 
+# precompiled structures for decoding the common integer sizes keyed by (size,byteorder)
+_integer_struct = dict(((struct.calcsize(prefix+fmt), order),struct.Struct(prefix+fmt)) for fmt in 'BHIQ' for prefix,order in (('<',config.byteorder.littleendian),('>',config.byteorder.bigendian)))
+
 class integer_t(ptype.type):
     '''Provides basic integer-like support'''
     byteorder = config.defaults.integer.order
@@ -215,10 +218,17 @@ class integer_t(ptype.type):
         if not self.initializedQ():
             raise error.InitializationError(self, 'num')
 
+        # use a precompiled structure if there's one for our size
+        data = self.serialize()
+        res = _integer_struct.get((len(data),self.byteorder))
+        if res is not None:
+            return res.unpack(data)[0]
+
+        # otherwise, convert it from a big-endian hexstring
         if self.byteorder is config.byteorder.bigendian:
-            return reduce(lambda x,y: x << 8 | ord(y), self.serialize(), 0)
+            return int(data.encode('hex'), 16) if data else 0
         elif self.byteorder is config.byteorder.littleendian:
-            return reduce(lambda x,y: x << 8 | ord(y), reversed(self.serialize()), 0)
+            return int(data[::-1].encode('hex'), 16) if data else 0
         raise error.SyntaxError(self, 'integer_t.int', message='Unknown integer endianness {!r}'.format(self.byteorder))
     __int__ = num = number = int
 
@@ -110,8 +110,9 @@ class string(base):
         if self.offset >= len(self.data):
             raise error.ConsumeError(self,self.offset,amount)
 
+        # read through a buffer of the array so that the data is only copied once
         minimum = min((self.offset+amount, len(self.data)))
-        res = self.data[self.offset : minimum].tostring()
+        res = buffer(self.data, self.offset, minimum - self.offset)[:]
         if res == '' and amount > 0:
             raise error.ConsumeError(self,self.offset,amount,len(res))
         if len(res) == amount:
@@ -232,7 +233,7 @@ class proxy(base):
         sl = list(cls.collect(object, left, right))
 
         # fix beginning element
-        n = sl.pop(0)
+        n = sl[0]
         source,bs,l = n.serialize(),n.blocksize(),left-n.getoffset()
         s = bs-l
         _ = source[:l] + data[:s] + source[l+s:]
@@ -241,8 +242,7 @@ class proxy(base):
         result += s    # sum the blocksize
 
         # fix elements in the middle
-        while len(sl) > 1:
-            n = sl.pop(0)
+        for n in itertools.islice(sl, 1, len(sl)-1):
             source,bs = n.serialize(),n.blocksize()
             _ = data[:bs] + source[len(data[:bs]):]
             n.load(offset=0, source=string(_))
@@ -250,8 +250,8 @@ class proxy(base):
             result += bs    # sum the blocksize
 
         # fix last element
-        if len(sl) > 0:
-            n = sl.pop(0)
+        if len(sl) > 1:
+            n = sl[-1]
             source,bs = n.serialize(),n.blocksize()
             _ = data[:bs] + source[len(data[:bs]):]
             padding = utils.padding.fill(bs - min(bs,len(_)), n.padding)
@@ -373,7 +373,7 @@ class stream(base):
 
         # select the requested data
         if (self.eof) or (o + amount <= len(self.data)):
-            result = self.data[o:o+amount].tostring()
+            result = buffer(self.data, o, amount)[:]
             self.offset += amount
             return result
 
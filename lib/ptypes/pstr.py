@@ -256,7 +256,18 @@ class string(ptype.type):
 
     def __setvalue__(self, value):
         '''Replaces the contents of ``self`` with the string ``value``.'''
-        size,glyphs = self.blocksize(),[x for x in value]
+        size = self.blocksize()
+
+        # the encoding is fixed-width, so if the whole string encodes to exactly
+        # our size then it's the same as setting each glyph individually.
+        try:
+            data = (__builtin__.unicode(value, 'ascii') if isinstance(value, __builtin__.str) else value).encode(self._object_.encoding.name)
+        except (UnicodeError, AttributeError):
+            data = None
+        if data is not None and len(data) == size:
+            return self.load(offset=0, source=provider.string(data))
+
+        glyphs = [x for x in value]
         t = dynamic.array(self._object_, len(glyphs))
         result = t(blocksize=lambda:size)
         for element,glyph in zip(result.alloc(), value):
@@ -75,10 +75,10 @@ class _pstruct_generic(ptype.container):
         return current
 
     def __getindex__(self, name):
-        if not isinstance(name, basestring):
-            raise error.UserError(self, '_pstruct_generic.__getindex__', message='Element names must be of a str type.')
         try:
             return self.__fastindex[name.lower()]
+        except (AttributeError, TypeError):
+            raise error.UserError(self, '_pstruct_generic.__getindex__', message='Element names must be of a str type.')
         except KeyError:
             for i,(_,n) in enumerate(self._fields_):
                 if n.lower() == name.lower():
@@ -110,9 +110,16 @@ class _pstruct_generic(ptype.container):
 
     # method overloads
     def __contains__(self, name):
+        try:
+            if name in self.__fastindex:
+                return True
+        except TypeError:
+            pass
+
+        # only validate the type of ``name`` when it wasn't found
         if not isinstance(name, basestring):
             raise error.UserError(self, '_pstruct_generic.__contains__', message='Element names must be of a str type.')
-        return name in self.__fastindex
+        return False
 
     def __iter__(self):
         if self.value is None:
@@ -123,8 +130,7 @@ class _pstruct_generic(ptype.container):
         return
 
     def __getitem__(self, name):
-        if not isinstance(name, basestring):
-            raise error.UserError(self, '_pstruct_generic.__contains__', message='Element names must be of a str type.')
+        # .__getindex__ is responsible for validating the type of ``name``
         return super(_pstruct_generic, self).__getitem__(name)
 
     def __setitem__(self, name, value):
@@ -172,20 +178,26 @@ class type(_pstruct_generic):
         """Allocate the current instance. Attach any elements defined in **fields to container."""
         attrs = __attrs__
         result = super(type, self).alloc(**attrs)
-        if fields:
-            for idx,(t,n) in enumerate(self._fields_):
-                if n not in fields:
-                    if ptype.isresolveable(t): result.value[idx] = self.new(t, __name__=n).alloc(**attrs)
-                    continue
-                v = fields[n]
-                if ptype.isresolveable(v) or ptype.istype(v):
-                    result.value[idx] = self.new(v, __name__=n).alloc(**attrs)
-                elif isinstance(v, ptype.generic):
-                    result.value[idx] = self.new(v, __name__=n)
-                else:
-                    result.value[idx].__setvalue__(v)
+        if not fields:
+            return result
+
+        # walk the fields once, resolving each element's replacement with a single lookup
+        missing = object()
+        values,new = result.value,self.new
+        isresolveable,istype = ptype.isresolveable,ptype.istype
+        for idx,(t,n) in enumerate(self._fields_):
+            v = fields.get(n, missing)
+            if v is missing:
+                if isresolveable(t): values[idx] = new(t, __name__=n).alloc(**attrs)
                 continue
-            self.setoffset(self.getoffset(), recurse=True)
+            if isresolveable(v) or istype(v):
+                values[idx] = new(v, __name__=n).alloc(**attrs)
+            elif isinstance(v, ptype.generic):
+                values[idx] = new(v, __name__=n)
+            else:
+                values[idx].__setvalue__(v)
+            continue
+        self.setoffset(self.getoffset(), recurse=True)
         return result
 
     def load(self, **attrs):
@@ -259,18 +271,22 @@ class type(_pstruct_generic):
     def __setvalue__(self, value=(), **individual):
         result = self
         if result.initializedQ():
+            fields = result._fields_
             if value:
-                if len(result._fields_) != len(value):
+                if len(fields) != len(value):
                     raise error.UserError(result, 'type.set', message='iterable value to assign with is not of the same length as struct')
                 result = super(type,result).__setvalue__(*value)
+
+            # hoist the lookups that are used for each individual field
+            values,getindex,new = result.value,self.__getindex__,self.new
             for k,v in individual.iteritems():
-                idx = self.__getindex__(k)
+                idx = getindex(k)
                 if ptype.isresolveable(v) or ptype.istype(v):
-                    result.value[idx] = self.new(v, __name__=k).a
+                    values[idx] = new(v, __name__=k).a
                 elif isinstance(v,ptype.generic):
-                    result.value[idx] = self.new(v, __name__=k)
+                    values[idx] = new(v, __name__=k)
                 else:
-                    result.value[idx].__setvalue__(v)
+                    values[idx].__setvalue__(v)
                 continue
             result.setoffset(result.getoffset(), recurse=True)
             return result
@@ -576,6 +592,22 @@ if __name__ == '__main__':
         if a['a'].int() == 5:
             raise Success
 
+    @TestCase
+    def test_structure_set_initialized_missing():
+        import pint
+        class st(pstruct.type):
+            _fields_ = [
+                (pint.uint8_t, 'a'),
+                (pint.uint16_t, 'b'),
+            ]
+        a = st().a
+        try:
+            a.set(c=6)
+        except KeyError:
+            if a['a'].int() == a['b'].int() == 0:
+                raise Success
+        raise Failure
+
 if __name__ == '__main__':
     import logging,config
     config.defaults.log.setLevel(logging.DEBUG)
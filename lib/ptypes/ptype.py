@@ -231,7 +231,7 @@ Example pointer_t usage:
             return number + 0x100
 """
 
-import sys,types,inspect,functools,itertools,operator,__builtin__
+import sys,types,functools,itertools,operator,re,logging,struct,__builtin__
 from . import bitmap,provider,utils,config,error
 Config = config.defaults
 Log = Config.log.getChild(__name__[len(__package__)+1:])
@@ -248,37 +248,34 @@ def iscallable(t):
     """True if type ``t`` is a code object that can be called"""
     return callable(t) and hasattr(t, '__call__')
 
-@utils.memoize('t')
 def istype(t):
     """True if type ``t`` inherits from ptype.type"""
-    return t.__class__ is t.__class__.__class__ and not isresolveable(t) and (isinstance(t, types.ClassType) or hasattr(object, '__bases__')) and issubclass(t, generic)
+    return isinstance(t, __builtin__.type) and issubclass(t, generic)
 
-@utils.memoize('t')
 def iscontainer(t):
     """True if type ``t`` inherits from ptype.container """
-    return (istype(t) and issubclass(t, container)) or pbinary.istype(t)
+    return isinstance(t, __builtin__.type) and issubclass(t, (container, pbinary.type))
 
-@utils.memoize('t')
 def isresolveable(t):
     """True if type ``t`` can be descended into"""
     return isinstance(t, (types.FunctionType, types.MethodType))    # or isiterator(t)
 
 def isrelated(t, t2):
     """True if type ``t`` is related to ``t2``"""
-    def getbases(result, bases):
-        for x in bases:
-            if not istype(x) or x in (type,container):
-                continue
-            result.add(x)
-            getbases(result, x.__bases__)
-        return result
-    return getbases(set(), t.__bases__).intersection( getbases(set(), t.__bases__) )
+    # the mro is already linearized by python, so just collect the ptypes
+    # from it that aren't one of the root types every ptype inherits from.
+    exclude = (type, container, base, generic)
+    def getbases(t):
+        return set(x for x in t.__mro__[1:] if istype(x) and x not in exclude)
+    return getbases(t).intersection(getbases(t2))
 
 def force(t, self, chain=None):
     """Resolve type ``t`` into a ptype.type for the provided object ``self``"""
-    if chain is None:
-        chain = []
-    chain.append(t)
+
+    # functions, bound methods, and generators are dispatched by their exact type
+    resolve = _force_dispatch.get(__builtin__.type(t))
+    if resolve is not None:
+        return resolve(t, self, [t] if chain is None else chain + [t])
 
     # of type pbinary.type. we insert a partial node into the tree
     if pbinary.istype(t):
@@ -289,99 +286,113 @@ def force(t, self, chain=None):
     if istype(t) or isinstance(t, base):
         return t
 
-    # functions
-    if isinstance(t, types.FunctionType):
-        res = t(self)
-        return force(res, self, chain)
-
-    # bound methods
-    if isinstance(t, types.MethodType):
-        return force(t(), self, chain)
-
-    if inspect.isgenerator(t):
-        return force(next(t), self, chain)
-
     if False:
         # and lastly iterators
         if isiterator(t):
             return force(next(t), self, chain)
 
+    # the chain is only materialized when we're unable to resolve the type
+    chain = [t] if chain is None else chain + [t]
     path = ','.join(self.backtrace())
     raise error.TypeError(self, 'force<ptype>', message='chain={!r} : Refusing request to resolve {!r} to a type that does not inherit from ptype.type : {{{:s}}}'.format(chain, t, path))
 
+_force_dispatch = {
+    types.FunctionType : lambda t, self, chain: force(t(self), self, chain),
+    types.MethodType : lambda t, self, chain: force(t(), self, chain),
+    types.GeneratorType : lambda t, self, chain: force(next(t), self, chain),
+}
+
 def debug(ptype, **attributes):
     """``rethrow`` all exceptions that occur during initialization of ``ptype``"""
     if not istype(ptype):
         raise error.UserError(ptype, 'debug', message='{!r} is not a ptype'.format(ptype))
 
     import time,traceback
+    now = time.time
+
+    def extract_stack(depth=4):
+        """Return the last ``depth`` frames ending at the caller in the same format as traceback.extract_stack"""
+        result, frame = [], sys._getframe(1)
+        while frame is not None and len(result) < depth:
+            code = frame.f_code
+            result.append((code.co_filename, frame.f_lineno, code.co_name, None))
+            frame = frame.f_back
+        result.reverse()
+        return result
+
     def logentry(string, *args):
-        return (time.time(),traceback.extract_stack(), string.format(*args))
+        return (now(),extract_stack(), string.format(*args))
 
-    if any((hasattr(n) for n in ('_debug_','_dump_'))):
+    if any((hasattr(ptype, n) for n in ('_debug_','_dump_'))):
         raise error.UserError(ptype, 'debug', message='{!r} has a private method name that clashes'.format(ptype))
 
-    class decorated_ptype(ptype):
+    class decorated(ptype):
         __doc__ = ptype.__doc__
         _debug_ = {}
 
         def __init__(self, *args, **kwds):
-            self._debug_['creation'] = time.time(),traceback.extract_stack(),self.backtrace(lambda s:s)
-            return super(decorated_ptype,self).__init__(*args,**kwds)
+            # each instance gets its own log so that they're not shared via the class
+            self._debug_ = dict(decorated._debug_)
+            self._debug_['creation'] = now(),extract_stack(),self.backtrace(lambda s:s)
+            return super(decorated,self).__init__(*args,**kwds)
 
         def _dump_(self, file):
             dbg = self._debug_
             if 'constructed' in dbg:
                 t,c = dbg['constructed']
                 _,st,bt = dbg['creation']
-                print >>file, "[{!r}] {:s} -> {:s} -> {:s}".format(t, c, self.instance(), self.__name__ if hasattr(self, '__name__') else '')
+                print >>file, "[{!r}] {!r} -> {:s} -> {:s}".format(t, c, self.instance(), self.__name__ if hasattr(self, '__name__') else '')
             else:
                 t,st,bt = dbg['creation']
                 print >>file, "[{!r}] {:s} -> {:s} -> {:s}".format(t, self.typename(), self.instance(), self.__name__ if hasattr(self, '__name__') else '')
 
             print >>file, 'Created by:'
-            print >>file, format_stack(st)
+            print >>file, ''.join(traceback.format_list(st))
             print >>file, 'Located at:'
             print >>file, '\n'.join('{:s} : {:s}'.format(x.instance(),x.name()) for x in bt)
             print >>file, 'Loads from store'
-            print >>file, '\n'.join('[:d] [{:f}] {:s}'.format(i, t, string) for i,(t,_,string) in enumerate(dbg['load']))
+            print >>file, '\n'.join('[{:d}] [{:f}] {:s}'.format(i, t, string) for i,(t,_,string) in enumerate(dbg.get('load',[])))
             print >>file, 'Writes to store'
-            print >>file, '\n'.join('[:d] [{:f}] {:s}'.format(i, t, string) for i,(t,_,string) in enumerate(dbg['commit']))
+            print >>file, '\n'.join('[{:d}] [{:f}] {:s}'.format(i, t, string) for i,(t,_,string) in enumerate(dbg.get('commit',[])))
             print >>file, 'Serialized to a string:'
-            print >>file, '\n'.join('[:d] [{:f}] {:s}'.format(i, t, string) for i,(t,_,string) in enumerate(dbg['serialize']))
+            print >>file, '\n'.join('[{:d}] [{:f}] {:s}'.format(i, t, string) for i,(t,_,string) in enumerate(dbg.get('serialize',[])))
             return
 
         def serialize(self):
             result = super(decorated, self).serialize()
             size = len(result)
-            _ = logentry('serialize() -> __len__ -> 0x{:x}', self.instance(), len(size))
-            Log.debug(' : '.join(self.instance(),_[-1]))
+            _ = logentry('serialize() -> __len__ -> 0x{:x}', size)
+            if Log.isEnabledFor(logging.DEBUG):
+                Log.debug('%s : %s', self.instance(), _[-1])
             self._debug_.setdefault('serialize',[]).append(_)
             return result
 
         def load(self, **kwds):
-            start = time.time()
+            start = now()
             result = super(decorated, self).load(**kwds)
-            end = time.time()
+            end = now()
 
             offset, size, source = self.getoffset(), self.blocksize(), self.source
-            _ = logentry('load({:s}) {:f} seconds -> (offset=0x{:x},size=0x{:x}) -> source={!r}', ','.join('{:s}={!r}'.format(k,v) for k,v in attrs.items()), end-start, offset, size, source)
-            Log.debug(' : '.join(self.instance(),_[-1]))
+            _ = logentry('load({:s}) {:f} seconds -> (offset=0x{:x},size=0x{:x}) -> source={!r}', ','.join('{:s}={!r}'.format(k,v) for k,v in kwds.items()), end-start, offset, size, source)
+            if Log.isEnabledFor(logging.DEBUG):
+                Log.debug('%s : %s', self.instance(), _[-1])
             self._debug_.setdefault('load',[]).append(_)
             return result
 
         def commit(self, **kwds):
-            start = time.time()
+            start = now()
             result = super(decorated, self).commit(**kwds)
-            end = time.time()
+            end = now()
 
-            _ = logentry('commit({:s}) {:f} seconds -> (offset=0x{:x},size=0x{:x}) -> source={!r}', ','.join('{:s}={!r}'.format(k,v) for k,v in attrs.items()), end-start, offset, size, source)
-            Log.debug(' : '.join(self.instance(),_[-1]))
+            offset, size, source = self.getoffset(), self.blocksize(), self.source
+            _ = logentry('commit({:s}) {:f} seconds -> (offset=0x{:x},size=0x{:x}) -> source={!r}', ','.join('{:s}={!r}'.format(k,v) for k,v in kwds.items()), end-start, offset, size, source)
+            if Log.isEnabledFor(logging.DEBUG):
+                Log.debug('%s : %s', self.instance(), _[-1])
             self._debug_.setdefault('commit',[]).append(_)
             return result
 
     decorated.__name__ = 'debug({:s})'.format(ptype.__name__)
-    decorated._debug_.update(attributes)
+    decorated._debug_ = dict(attributes)
     return decorated
 
 def debugrecurse(ptype):
@@ -398,6 +409,7 @@ def debugrecurse(ptype):
     return decorated
 
 source = provider.memory()
+_compare_runs = re.compile(r'(?:00)+|(?:(?!00)..)+')  # runs of equal/different bytes in a hexadecimal xor
 class _base_generic(object):
     # XXX: this class should implement
     #           attribute inheritance
@@ -407,29 +419,34 @@ class _base_generic(object):
     #           XXX meta-related information
     #           instance tree navigation
 
-    __slots__ = ('__source','attributes','ignored','parent','value','position')
+    __slots__ = ('parent','value','position','attributes','_source')
 
     # FIXME: it'd probably be a good idea to have this not depend on globals.source,
     #        and instead have globals.source depend on this.
-    __source = None      # ptype.prov
+    _source = None        # ptype.prov
     @property
     def source(self):
-        if self.parent is None:
-            global source
-            return source if self.__source is None else self.__source
-        return self.parent.source if self.__source is None else self.__source
+        # walk up to the first instance that has an explicit source rather
+        # than re-entering this property for every parent in the chain
+        node = self
+        while node._source is None:
+            if node.parent is None:
+                global source
+                return source
+            node = node.parent
+        return node._source
     @source.setter
     def source(self, value):
-        self.__source = value
+        self._source = value
 
     attributes = None        # {...}
     ignored = set(('source','parent','attributes','value','__name__','position'))
 
     parent = None       # ptype.base
-    p = property(fget=lambda s: s.parent)   # abbr to get to .parent
+    p = property(fget=operator.attrgetter('parent'))   # abbr to get to .parent
 
     value = None        # _
-    v = property(fget=lambda s: s.value)   # abbr to get to .value
+    v = property(fget=operator.attrgetter('value'))   # abbr to get to .value
 
     def __init__(self, **attrs):
         """Create a new instance of object. Will assign provided named arguments to self.attributes"""
@@ -448,26 +465,32 @@ class _base_generic(object):
         Any attributes defined under the 'recurse' key will be propagated to any
         sub-elements.
         """
-        attrs = dict(attrs)
-        attrs.update(moreattrs)
-        recurse = dict(attrs.pop('recurse', {}))
-        ignored = self.ignored
-
-        # update self with all attributes
-        res = {}
-        res.update(recurse)
-        res.update(attrs)
-        for k,v in res.iteritems():
+        recurse = moreattrs.pop('recurse', None) if 'recurse' in moreattrs else attrs.get('recurse', None)
+
+        # update self with all attributes. the recursive ones are assigned first
+        # so that any of the explicit attributes will take precedence.
+        if recurse:
+            for k,v in recurse.iteritems():
+                setattr(self, k, v)
+        for k,v in attrs.iteritems():
+            if k != 'recurse': setattr(self, k, v)
+        for k,v in moreattrs.iteritems():
             setattr(self, k, v)
 
+        # nothing to propagate to any sub-elements
+        if not recurse:
+            return self
+
         # filter out ignored attributes from the recurse dictionary
-        recurse = dict((k,v) for k,v in recurse.iteritems() if k not in ignored)
+        ignored = self.ignored
+        if not ignored.isdisjoint(recurse):
+            recurse = dict((k,v) for k,v in recurse.iteritems() if k not in ignored)
 
         # update self (for instantiated elements)
         self.attributes.update(recurse)
 
         # update sub-elements with recursive attributes
-        if recurse and issubclass(self.__class__, container) and self.value is not None:
+        if recurse and isinstance(self, container) and self.value is not None:
             [n.__update__(recurse, recurse=recurse) for n in self.value]
         return self
 
@@ -475,18 +498,20 @@ class _base_generic(object):
         """Return a tuple of properties/characteristics describing the current state of the object to the user"""
         result = {}
 
+        # each of the sizes can be expensive to calculate, so only do it once
         try:
-            if self.blocksize() < self.size():
-                result['overcommit'] = True
+            bs,sz = self.blocksize(),self.size()
 
         except error.InitializationError:
             result['uninitialized'] = True
 
         else:
-            if self.blocksize() > self.size():
+            if bs < sz:
+                result['overcommit'] = True
+            elif bs > sz:
                 result['underload'] = True
 
-        if not hasattr(self, '__name__') or not self.__name__:
+        if not getattr(self, '__name__', None):
             result['unnamed'] = True
         return result
 
@@ -495,45 +520,63 @@ class _base_generic(object):
 
         This will iterate in a top-down approach.
         """
-        for self in edges(self, **kwds):
-            if not isinstance(self, generic):
+        # walk the tree with an explicit stack of edge iterators so that
+        # deep trees don't nest a generator (and a frame) for every level
+        stack = [iter(edges(self, **kwds))]
+        while stack:
+            for node in stack[-1]:
+                if isinstance(node, generic):
+                    break
+                continue
+            else:
+                stack.pop()
                 continue
 
-            if filter(self):
-                yield self
-
-            for y in self.traverse(edges=edges, filter=filter, **kwds):
-                yield y
-            continue
+            if filter(node):
+                yield node
+            stack.append(iter(edges(node, **kwds)))
         return
 
     def __repr__(self):
         """Calls .repr() to display the details of a specific object"""
         prop = ','.join('{:s}={!r}'.format(k,v) for k,v in self.properties().iteritems())
         result = self.repr()
+        classname,name = self.classname(),self.name()
 
         # multiline
-        if result.count('\n') > 0:
+        if '\n' in result:
             if prop:
-                return "{:s} '{:s}' {{{:s}}}\n{:s}".format(utils.repr_class(self.classname()),self.name(),prop,result)
-            return "{:s} '{:s}'\n{:s}".format(utils.repr_class(self.classname()),self.name(),result)
+                return "{:s} '{:s}' {{{:s}}}\n{:s}".format(utils.repr_class(classname),name,prop,result)
+            return "{:s} '{:s}'\n{:s}".format(utils.repr_class(classname),name,result)
 
-        _hex,_precision = Config.pbinary.offset == config.partial.hex, 3 if Config.pbinary.offset == config.partial.fractional else 0
+        offset = Config.pbinary.offset
+        _hex,_precision = offset == config.partial.hex, 3 if offset == config.partial.fractional else 0
         # single-line
-        descr = "{:s} '{:s}'".format(utils.repr_class(self.classname()), self.name()) if self.value is None else utils.repr_instance(self.classname(),self.name())
+        position = utils.repr_position(self.getposition(), hex=_hex, precision=_precision)
+        descr = "{:s} '{:s}'".format(utils.repr_class(classname), name) if self.value is None else utils.repr_instance(classname,name)
         if prop:
-            return "[{:s}] {:s} {{{:s}}} {:s}".format(utils.repr_position(self.getposition(), hex=_hex, precision=_precision), descr, prop, result)
-        return "[{:s}] {:s} {:s}".format(utils.repr_position(self.getposition(), hex=_hex, precision=_precision), descr, result)
+            return "[{:s}] {:s} {{{:s}}} {:s}".format(position, descr, prop, result)
+        return "[{:s}] {:s} {:s}".format(position, descr, result)
 
     # naming
     @classmethod
     def typename(cls):
         """Return the name of the ptype"""
-        if hasattr(cls, '__module__') and cls.__module__ is not None:
-            if Config.display.show_module_name:
-                return '.'.join((cls.__module__, cls.__name__))
-            return '.'.join((cls.__module__.rsplit('.',1)[-1], cls.__name__))
-        return cls.__name__
+        key = Config.display.show_module_name, getattr(cls, '__module__', None), cls.__name__
+
+        # the name is cached in the class itself, and is only re-used if the
+        # configuration or the class' naming hasn't been changed since.
+        cache = cls.__dict__.get('_typename_')
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        show,module,name = key
+        if module is not None:
+            result = '.'.join((module, name)) if show else '.'.join((module.rsplit('.',1)[-1], name))
+        else:
+            result = name
+        cls._typename_ = key,result
+        return result
     def classname(self):
         """Return the dynamic classname. Can be overwritten."""
         return self.typename()
@@ -630,13 +673,15 @@ class _base_generic(object):
         #if self.__class__ == t or self is t or (isinstance(t,__builtin__.type) and (isinstance(self,t) or issubclass(self.__class__,t))):
         #    return self
 
-        for x in self.traverse(edges=lambda node:(node.parent for x in range(1) if node.parent is not None)):
-            if x.parent is t or (isinstance(t,__builtin__.type) and (isinstance(x,t) or issubclass(x.__class__,t))):
-                return x
-            continue
+        # walk up the parents directly rather than through .traverse
+        node,isclass = self.parent,isinstance(t,__builtin__.type)
+        while node is not None:
+            if node.parent is t or (isclass and isinstance(node,t)):
+                return node
+            node = node.parent
 
         # XXX
-        chain = ';'.join(utils.repr_instance(x.classname(),x.name()) for x in self.traverse(edges=lambda node:(node.parent for x in range(1) if node.parent is not None)))
+        chain = ';'.join(reversed(self.backtrace(lambda x:utils.repr_instance(x.classname(),x.name()))))
         try: bs = hex(self.blocksize())
         except: bs = '???'
         raise error.NotFoundError(self, 'base.getparent', message="match {:s} not found in chain : {:s}[{:x}:+{:s}] : {:s}".format(type.typename(), self.classname(), self.getoffset(), bs, chain))
@@ -648,9 +693,12 @@ class _base_generic(object):
         By default this returns a string describing the type and location of
         each structure.
         """
-        path = self.traverse(edges=lambda node:(node.parent for x in range(1) if node.parent is not None))
-        path = [ fn(x) for x in path ]
-        return list(reversed(path))
+        path,node = [],self.parent
+        while node is not None:
+            path.append(fn(node))
+            node = node.parent
+        path.reverse()
+        return path
 
     def new(self, t, **attrs):
         """Create a new instance of ``ptype`` with the provided ``attrs``
@@ -667,10 +715,6 @@ class _base_generic(object):
 
         attrs.setdefault('parent', self)
 
-        # instantiate an instance if we're given a type
-        if not(istype(t) or isinstance(t,generic)):
-            raise error.TypeError(self, 'base.new', message='{!r} is not a ptype class'.format(t.__class__))
-
         # if it's a type, then instantiate it
         if istype(t):
             t = t(**attrs)
@@ -679,6 +723,10 @@ class _base_generic(object):
         elif isinstance(t,generic):
             t.__update__(**attrs)
 
+        # otherwise we don't know how to instantiate it
+        else:
+            raise error.TypeError(self, 'base.new', message='{!r} is not a ptype class'.format(t.__class__))
+
         # give the instance a default name
         if '__name__' in attrs:
             t.__name__ = attrs['__name__']
@@ -686,7 +734,7 @@ class _base_generic(object):
 
 class generic(_base_generic):
     '''A class shared between both pbinary.*, ptype.*'''
-    initialized = property(fget=lambda s: s.initializedQ())
+    initialized = property(fget=operator.methodcaller('initializedQ'))
 
     def initializedQ(self):
         raise error.ImplementationError(self, 'base.initializedQ')
@@ -721,9 +769,9 @@ class generic(_base_generic):
         return self.load(**attrs)
 
     # abbreviations
-    a = property(fget=lambda s: s.alloc())  # alloc
-    c = property(fget=lambda s: s.commit()) # commit
-    l = property(fget=lambda s: s.load())   # load
+    a = property(fget=operator.methodcaller('alloc'))  # alloc
+    c = property(fget=operator.methodcaller('commit')) # commit
+    l = property(fget=operator.methodcaller('load'))   # load
     li = property(fget=lambda s: s.load() if not s.initializedQ() else s) # load if uninitialized
 
     def get(self):
@@ -749,10 +797,13 @@ class generic(_base_generic):
 
         To compare the actual contents, see .compare(other)
         """
-        if self.initializedQ() != other.initializedQ():
+        initialized = self.initializedQ()
+        if initialized != other.initializedQ():
             return -1
-        if self.initializedQ():
-            return 0 if (self.getposition(),self.serialize()) == (other.getposition(),other.serialize()) else -1
+
+        # compare the position first so that we only serialize when it matches
+        if initialized:
+            return 0 if self.getposition() == other.getposition() and self.serialize() == other.serialize() else -1
         return 0 if (self.getposition(),self.blocksize()) == (other.getposition(),other.blocksize()) else +1
 
 class base(generic):
@@ -798,13 +849,29 @@ class base(generic):
         if s == o:
             return
 
-        comparison = (bool(ord(x)^ord(y)) for x,y in zip(s,o))
-        result = [(different,len(list(times))) for different,times in itertools.groupby(comparison)]
-        index = 0
-        for diff,length in result:
-            #if diff: yield index,length
-            if diff: yield index,(s[index:index+length],o[index:index+length])
-            index += length
+        # walk both strings a page at a time so that identical pages can be
+        # skipped with a single string comparison. any page that differs is
+        # xor'd as a single long so the byte-wise work stays in C. every '00'
+        # pair in the hexadecimal result is an identical byte, so tokenizing
+        # it into runs of equal and differing pairs gives us each range that
+        # is different. runs that cross a page boundary are merged.
+        index = min(len(s),len(o))
+        start = end = None
+        for offset in xrange(0, index, 0x1000):
+            a,b = s[offset:min(offset+0x1000,index)],o[offset:min(offset+0x1000,index)]
+            if a == b: continue
+            x = int(a.encode('hex'),16) ^ int(b.encode('hex'),16)
+            for m in _compare_runs.finditer('{:0{:d}x}'.format(x, len(a)*2)):
+                if m.group(0).startswith('00'): continue
+                left,right = offset+m.start()/2,offset+m.end()/2
+                if left == end:
+                    end = right
+                    continue
+                #if start is not None: yield start,end-start
+                if start is not None: yield start,(s[start:end],o[start:end])
+                start,end = left,right
+            continue
+        if start is not None: yield start,(s[start:end],o[start:end])
 
         if len(s) != len(o):
             #yield index,max(len(s),len(o))-index
@@ -894,28 +961,31 @@ class base(generic):
         #edges = lambda node:tuple(node.value) if iscontainer(node.__class__) else ()
         #encoded = lambda node: (node.d,) if isinstance(node, encoded_t) else ()
         #itertools.chain(self.traverse(edges, filter=filter, *args, **kwds), self.traverse(encoded, filter=filter, *args, **kwds)):
-        duplicates = set()
+        # track each instance by its id so that a lookup never has to call
+        # back into the instance's comparison operators. the instance is kept
+        # as the value so that its id can't be reused while we're collecting.
+        duplicates = {}
         if parentTester == self:
             yield self
-        duplicates.add(self)
+        duplicates[id(self)] = self
         for n in self.traverse(filter=lambda n: parentTester == n):
             if n.parent is None:
-                if n not in duplicates:
+                if id(n) not in duplicates:
                     yield n
-                    duplicates.add(n)
+                    duplicates[id(n)] = n
                 continue
             try:
                 result = n.d.l
             except Exception:
                 continue
-            if result not in duplicates:
+            if id(result) not in duplicates:
                 yield result
-                duplicates.add(result)
+                duplicates[id(result)] = result
             for o in result.collect():
                 result = o.getparent(parentTester)
-                if result not in duplicates:
+                if id(result) not in duplicates:
                     yield result
-                    duplicates.add(result)
+                    duplicates[id(result)] = result
                 continue
             continue
         return
@@ -954,12 +1024,13 @@ class type(base):
     def __deserialize_block__(self, block):
         """Load type using the string provided by ``block``"""
         bs = self.blocksize()
+
+        # slicing a string that is already the right size won't copy it
+        self.value = block[:bs]
         if len(block) < bs:
-            self.value = block[:bs]
             raise StopIteration(self.name(), len(block))
 
         # all is good.
-        self.value = block[:bs]
         return self
 
     def serialize(self):
@@ -983,11 +1054,16 @@ class type(base):
                 return ''
 
             # generate padding up to the blocksize
-            Log.info('type.serialize : {:s} : Padding result due to element being partially uninitialized during serialization : 0x{:x}'.format(self.instance(), res))
+            if Log.isEnabledFor(logging.INFO):
+                Log.info('type.serialize : {:s} : Padding result due to element being partially uninitialized during serialization : 0x{:x}'.format(self.instance(), res))
             padding = utils.padding.fill(res if res > 0 else 0, self.padding)
 
-            # prefix beginning of padding with any data that element contains
-            return padding if self.value is None else self.value + padding[len(self.value):]
+            # prefix beginning of padding with any data that element contains. the
+            # padding is always generated up to the blocksize so that a cycling
+            # padding source stays aligned to the element's offset.
+            if not self.value:
+                return padding
+            return self.value + padding[len(self.value):] if len(self.value) < len(padding) else self.value
 
         # take the current value as a string, which should match up to .size()
         result = self.value
@@ -995,7 +1071,8 @@ class type(base):
         # pad up to the .blocksize() if our length doesn't meet the minimum
         res = self.blocksize()
         if len(result) < res:
-            Log.info('type.serialize : {:s} : Padding result due to element being partially initialized during serialization : 0x{:x}'.format(self.instance(), res))
+            if Log.isEnabledFor(logging.INFO):
+                Log.info('type.serialize : {:s} : Padding result due to element being partially initialized during serialization : 0x{:x}'.format(self.instance(), res))
             padding = utils.padding.fill(res-len(result), self.padding)
             result += padding
         return result
@@ -1058,17 +1135,28 @@ class container(base):
         """True if the type is fully initialized"""
         if self.value is None:
             return False
-        return all(x is not None and x.initializedQ() for x in self.value) and self.size() >= self.blocksize()
+
+        # if .size() has been overloaded, then we can't total the elements ourselves
+        if getattr(self.size, 'im_func', None) is not container.size.im_func:
+            return all(x is not None and x.initializedQ() for x in self.value) and self.size() >= self.blocksize()
+
+        # otherwise sum up the size of each element as it's being checked
+        total = 0
+        for x in self.value:
+            if x is None or not x.initializedQ():
+                return False
+            total += x.size()
+        return total >= self.blocksize()
 
     def size(self):
         """Returns a sum of the number of bytes that are currently in use by all sub-elements"""
-        return sum(n.size() for n in self.value or [])
+        return sum(map(operator.methodcaller('size'), self.value or []))
 
     def blocksize(self):
         """Returns a sum of the bytes that are expected to be read"""
         if self.value is None:
             raise error.InitializationError(self, 'container.blocksize')
-        return sum(n.blocksize() for n in self.value)
+        return sum(map(operator.methodcaller('blocksize'), self.value))
 
     def getoffset(self, field=None):
         """Returns the current offset.
@@ -1086,7 +1174,7 @@ class container(base):
             return self[name].getoffset(res) if len(res) > 0 else self.getoffset(name)
 
         index = self.__getindex__(field)
-        return self.getoffset() + sum(x.size() for x in self.value[:index])
+        return self.getoffset() + sum(x.size() for x in itertools.islice(self.value, index))
 
     def __getindex__(self, name):
         """Searches the .value attribute for an element with the provided ``name``
@@ -1163,11 +1251,27 @@ class container(base):
     def setposition(self, offset, recurse=False):
         offset, = offset
         res = super(container, self).setposition((offset,), recurse=recurse)
-        if recurse and self.value is not None:
-            for n in self.value:
+        if not recurse or self.value is None:
+            return res
+
+        # walk the sub-elements with an explicit stack instead of recursing
+        # into each container. a sub-container is only measured after all of
+        # its own elements have been moved, same as if it was called directly.
+        stack, iterable = [], iter(self.value)
+        while True:
+            for n in iterable:
+                if isinstance(n, container) and n.value is not None and n.setposition.im_func is container.setposition.im_func:
+                    super(container, n).setposition((offset,), recurse=recurse)
+                    stack.append((iterable, offset, n))
+                    iterable = iter(n.value)
+                    break
                 n.setposition((offset,), recurse=recurse)
                 offset += n.size() if n.initializedQ() else n.blocksize()
-            return res
+            else:
+                if not stack:
+                    break
+                iterable, offset, n = stack.pop()
+                offset += n.size() if n.initializedQ() else n.blocksize()
         return res
 
     def __deserialize_block__(self, block):
@@ -1177,21 +1281,24 @@ class container(base):
 
         value,expected = self.value[:],self.blocksize()
 
-        # read everything up to the blocksize
+        # read everything up to the blocksize. the total is used as a cursor
+        # into block so that the remainder isn't copied for every element.
+        index,count = 0,len(value)
         bs,total = 0,0
-        while value and total < expected:
-            res = value.pop(0)
+        while index < count and total < expected:
+            res = value[index]
+            index += 1
             bs = res.blocksize()
-            res.__deserialize_block__(block[:bs])
-            block = block[bs:]
+            res.__deserialize_block__(block[total:total+bs])
             total += bs
 
         # ..and then fill out any zero sized elements
-        while value:
-            res = value.pop(0)
+        while index < count:
+            res = value[index]
+            index += 1
             bs = res.blocksize()
             if bs != 0: break
-            res.__deserialize_block__(block[:bs])
+            res.__deserialize_block__(block[total:total+bs])
 
         # log any information about deserialization errors
         if total < expected:
@@ -1199,8 +1306,9 @@ class container(base):
             Log.warn('container.__deserialize_block__ : {:s} : Container less than expected blocksize : 0x{:x} < 0x{:x} : {{{:s}}}'.format(self.instance(), total, expected, path))
             raise StopIteration(self.name(), total) # XXX
         elif total > expected:
-            path = ' -> '.join(self.backtrace())
-            Log.debug('container.__deserialize_block__ : {:s} : Container larger than expected blocksize : 0x{:x} > 0x{:x} : {{{:s}}}'.format(self.instance(), total, expected, path))
+            if Log.isEnabledFor(logging.DEBUG):
+                path = ' -> '.join(self.backtrace())
+                Log.debug('container.__deserialize_block__ : {:s} : Container larger than expected blocksize : 0x{:x} > 0x{:x} : {{{:s}}}'.format(self.instance(), total, expected, path))
             raise error.LoadError(self, consumed=total) # XXX
         return self
 
@@ -1208,14 +1316,19 @@ class container(base):
         """Return contents of all sub-elements concatenated as a string"""
 
         # check the blocksize(), if it's invalid then return what we have since we can't figure out the padding anyways
+        # collect the pieces first so that any padding can be joined along with
+        # them instead of re-copying the entire result to append it.
+        data = [n.serialize() for n in self.value]
         try:
             bs = self.blocksize()
         except:
-            return str().join(n.serialize() for n in self.value)
-        result = str().join(n.serialize() for n in self.value)
+            return str().join(data)
+        size = sum(map(len, data))
 
-        # clamp the blocksize if we're outside the bounds of the parent
-        if isinstance(self.parent,container):
+        # clamp the blocksize if we're outside the bounds of the parent. this is
+        # only needed when we'll be padding, as the parent's blocksize has to
+        # visit every one of its elements in order to be calculated.
+        if size < bs and isinstance(self.parent,container):
             parentSize = self.parent.blocksize()
             childOffset = self.getoffset() - self.parent.getoffset()
             maxElementSize = parentSize - childOffset
@@ -1226,19 +1339,21 @@ class container(base):
         # if the blocksize is larger than maxint, then ignore the padding
         if bs > sys.maxint:
             Log.warn('container.serialize : {:s} : blocksize is larger than sys.maxint. Refusing to add padding : 0x{:x} > 0x{:x}'.format(self.instance(), bs, sys.maxint))
-            return result
+            return str().join(data)
 
         # if the result is smaller then the blocksize, then pad the rest in
-        if len(result) < bs:
-            Log.info('container.serialize : {:s} : Padding result due to element being partially uninitialized during serialization : 0x{:x}'.format(self.instance(), bs))
-            result += utils.padding.fill(bs - len(result), self.padding)
+        if size < bs:
+            if Log.isEnabledFor(logging.INFO):
+                Log.info('container.serialize : {:s} : Padding result due to element being partially uninitialized during serialization : 0x{:x}'.format(self.instance(), bs))
+            data.append(utils.padding.fill(bs - size, self.padding))
 
         # if it's larger then the blocksize, then warn the user about it
-        if len(result) > bs:
-            Log.debug('container.serialize : {:s} : Container larger than expected blocksize : 0x{:x} > 0x{:x}'.format(self.instance(), len(result), bs))
+        elif size > bs:
+            if Log.isEnabledFor(logging.DEBUG):
+                Log.debug('container.serialize : {:s} : Container larger than expected blocksize : 0x{:x} > 0x{:x}'.format(self.instance(), size, bs))
 
         # otherwise, our result should appear correct
-        return result
+        return str().join(data)
 
     def alloc(self, **attrs):
         """Will zero the ptype.container instance with the provided ``attrs``.
@@ -1249,11 +1364,9 @@ class container(base):
         # If there's a custom .blocksize changing the way this instance get's loaded
         #   then restore the original blocksize temporarily so that .alloc will actually
         #   allocate the entire object.
-        if getattr(self.blocksize, 'im_func', None) is not container.blocksize.im_func:
-            instancemethod = type.new.__class__
-            func = container.blocksize.im_func
-            method = instancemethod(func, self, self.__class__)
-            attrs.setdefault('blocksize', method)
+        func = container.blocksize.im_func
+        if 'blocksize' not in attrs and getattr(self.blocksize, 'im_func', None) is not func:
+            attrs['blocksize'] = types.MethodType(func, self, self.__class__)
 
         return super(container, self).alloc(**attrs)
 
@@ -1269,16 +1382,20 @@ class container(base):
 
                 # load each element individually up to the blocksize
                 bs,value = 0,self.value[:]
-                left,right = self.getoffset(),self.getoffset()+self.blocksize()
-                while value and left < right:
-                    res = value.pop(0)
+                index,count = 0,len(value)
+                left = self.getoffset()
+                right = left + self.blocksize()
+                while index < count and left < right:
+                    res = value[index]
+                    index += 1
                     bs,ofs = res.blocksize(),res.getoffset()
-                    left = res.getoffset() if left + bs < ofs else left + bs
+                    left = ofs if left + bs < ofs else left + bs
                     res.load(**attrs)
 
                 # ..and then load any zero-sized elements that were left
-                while value:
-                    res = value.pop(0)
+                while index < count:
+                    res = value[index]
+                    index += 1
                     if res.blocksize() != 0: break
                     res.load(**attrs)
                 return self
@@ -1293,7 +1410,8 @@ class container(base):
             if s < bs:
                 Log.warning('container.load : {:s} : Unable to complete read : at {{{:x}:+{:x}}} : {!r}'.format(self.instance(), ofs, s, e))
             else:
-                Log.debug('container.load : {:s} : Cropped to {{{:x}:+{:x}}} : {!r}'.format(self.instance(), ofs, s, e))
+                if Log.isEnabledFor(logging.DEBUG):
+                    Log.debug('container.load : {:s} : Cropped to {{{:x}:+{:x}}} : {!r}'.format(self.instance(), ofs, s, e))
         return self
 
     def commit(self, **attrs):
@@ -1323,7 +1441,7 @@ class container(base):
         """Performs a deep-copy of self repopulating the new instance if self is initialized"""
         # create an instance of self and update with requested attributes
         result = super(container,self).copy(**attrs)
-        result.value = map(operator.methodcaller('copy', **attrs),self.value)
+        result.value = [n.copy(**attrs) for n in self.value]
         return result
 
     def compare(self, other, *args, **kwds):
@@ -1351,10 +1469,8 @@ class container(base):
 
         for ofs,(s,o) in super(container,self).compare(other):
             if len(s) == 0:
-                i = other.value.index(other.field(ofs, recurse=False))
                 yield ofs, (None, tuple(between(other,(ofs,other.blocksize()))))
             elif len(o) == 0:
-                i = self.value.index(self.field(ofs, recurse=False))
                 yield ofs, (tuple(between(self,(ofs,self.blocksize()))),None)
             else:
                 if len(s) != len(o):
@@ -1412,11 +1528,12 @@ class container(base):
 
     def __iter__(self):
         if self.value is None:
-            raise error.InitializationError(self, 'container.__iter__')
-
-        for res in self.value:
-            yield res
-        return
+            return self.__uninitialized_iter()
+        return iter(self.value)
+    def __uninitialized_iter(self):
+        # a generator so that the error is raised by the first next() and not by iter()
+        raise error.InitializationError(self, 'container.__iter__')
+        yield
 
     def __setvalue__(self, *elements):
         """Set ``self`` with instances or copies of the types provided in the iterable ``elements``.
@@ -1429,25 +1546,27 @@ class container(base):
 
         This is an internal function and is not intended to be used outside of ptypes.
         """
-        if self.initializedQ() and len(self.value) == len(elements):
-            for idx,(val,ele) in enumerate(zip(self.value,elements)):
-                name = getattr(val,'__name__',None)
-                if isresolveable(ele) or istype(ele):
-                    self.value[idx] = self.new(ele, __name__=name).a
-                elif isinstance(ele,generic):
-                    self.value[idx] = self.new(ele, __name__=name)
+        new,value = self.new,self.value
+
+        # instances are checked for first as they're the cheapest to identify
+        if self.initializedQ() and len(value) == len(elements):
+            for idx,(val,ele) in enumerate(zip(value,elements)):
+                if isinstance(ele,generic):
+                    value[idx] = new(ele, __name__=getattr(val,'__name__',None))
+                elif isresolveable(ele) or istype(ele):
+                    value[idx] = new(ele, __name__=getattr(val,'__name__',None)).a
                 else:
                     val.__setvalue__(ele)
                 continue
-        elif all(isresolveable(x) or istype(x) or isinstance(x,generic) for x in elements):
-            self.value = [ self.new(x) if isinstance(x,generic) else self.new(x).a for x in elements ]
+        elif all(isinstance(x,generic) or isresolveable(x) or istype(x) for x in elements):
+            self.value = [ new(x) if isinstance(x,generic) else new(x).a for x in elements ]
         else:
             raise error.AssertionError(self, 'container.set', message='Invalid number or type of elements to assign with : {!r}'.format(elements))
         self.setoffset(self.getoffset(), recurse=True)
         return self
 
     def __getvalue__(self):
-        return tuple((v.__getvalue__() for v in self.value))
+        return tuple(map(operator.methodcaller('__getvalue__'), self.value))
 
     def __getstate__(self):
         return (super(container,self).__getstate__(),self.source, self.attributes, self.ignored, self.parent, self.position)
@@ -1477,11 +1596,9 @@ class undefined(type):
 class block(type):
     """A ptype that can be accessed as an array"""
     def __getslice__(self, i, j):
-        buffer = self.value[:]
-        return buffer[i:j]
+        return self.value[i:j]
     def __getitem__(self, index):
-        buffer = self.value[:]
-        return buffer[index]
+        return self.value[index]
     def repr(self, **options):
         """Display all ptype.block instances as a hexdump"""
         if not self.initializedQ():
@@ -1490,12 +1607,13 @@ class block(type):
             return self.details(**options)
         return self.summary(**options)
     def __setitem__(self, index, value):
-        self.value = self.value[:index] + value + self.value[index+1:]
+        v = self.value
+        self.value = str().join((v[:index], value, v[index+1:]))
     def __setslice__(self, i, j, value):
         v = self.value
         if len(value) != j-i:
             raise ValueError('block.__setslice__ : {:s} : Unable to reassign slice outside of bounds of object : ({:d}, {:d}) : {:d}'.format(self.instance(), i, j, len(value)))
-        self.value = v[:i] + value + v[j:]
+        self.value = str().join((v[:i], value, v[j:]))
 
 #@utils.memoize('cls', newattrs=lambda n:tuple(sorted(n.iteritems())))
 def clone(cls, **newattrs):
@@ -1503,11 +1621,9 @@ def clone(cls, **newattrs):
     will clone a class, and set its attributes to **newattrs
     intended to aid with single-line coding.
     '''
-    class _clone(cls):
-        __doc__ = cls.__doc__
-        def classname(self):
-            cn = super(_clone,self).classname()
-            return Config.ptype.clone_name.format(cn, **(utils.attributes(self) if Config.display.mangle_with_attributes else {}))
+    def classname(self):
+        cn = super(_clone,self).classname()
+        return Config.ptype.clone_name.format(cn, **(utils.attributes(self) if Config.display.mangle_with_attributes else {}))
 
     newattrs.setdefault('__name__', cls.__name__)
     if hasattr(cls, '__module__'):
@@ -1516,12 +1632,12 @@ def clone(cls, **newattrs):
     ignored = cls.ignored
     recurse = dict(newattrs.pop('recurse', {}))
 
-    # update class with all attributes
-    res = {}
+    # create the class with all of its attributes in one step via its
+    # metaclass instead of assigning them to it one at a time afterwards
+    res = {'__doc__':cls.__doc__, 'classname':classname}
     res.update(recurse)
     res.update(newattrs)
-    for k,v in res.items():
-        setattr(_clone, k, v)
+    _clone = cls.__class__(res.pop('__name__'), (cls,), res)
 
     # filter out ignored attributes from recurse dictionary
     recurse = dict((k,v) for k,v in recurse.iteritems() if k not in ignored)
@@ -1661,7 +1777,9 @@ class definition(object):
         If any ``attributes`` are defined, the definition is duplicated with the specified attributes before being added to the cache.
         """
         def clone(definition):
-            res = dict(definition.__dict__)
+            # the duplicate inherits from definition, so only the attributes
+            # that aren't inherited need to be part of its namespace
+            res = {'__module__':definition.__module__, '__doc__':definition.__doc__}
             res.update(attributes)
             #res = __builtin__.type(res.pop('__name__',definition.__name__), definition.__bases__, res)
             res = __builtin__.type(res.pop('__name__',definition.__name__), (definition,), res)
@@ -1822,23 +1940,16 @@ class encoded_t(wrapper_t):
     deref = lambda s,**a: s.dereference(**a)
     ref = lambda s,*x,**a: s.reference(*x,**a)
 
-    @utils.memoize('self', self=lambda n:(n._object_,n.value), attrs=lambda n:tuple(sorted(n.items())))
     def decode(self, object, **attrs):
         """Take ``data`` and decode it back to it's original form"""
-        for n in ('offset','source','parent'):
-            attrs.has_key(n) and attrs.pop(n)
-
-        # attach decoded object to encoded_t
+        # attach decoded object to encoded_t (replacing any offset, source, or parent)
         attrs['offset'], attrs['source'], attrs['parent'] = 0, provider.proxy(self,autocommit={}), self
         object.__update__(attrs)
         return object
 
     def encode(self, object, **attrs):
         """Take ``data`` and return it in encoded form"""
-        for n in ('offset','source','parent'):
-            attrs.has_key(n) and attrs.pop(n)
-
-        # attach encoded object to encoded_t
+        # attach encoded object to encoded_t (replacing any offset, source, or parent)
         attrs['offset'], attrs['source'], attrs['parent'] = 0, provider.proxy(self, autocommit={}), self
         object.__update__(attrs)
         return object
@@ -1847,10 +1958,8 @@ class encoded_t(wrapper_t):
         '''This hooks ``object`` with a .load and .commit that will write to the encoded_t'''
 
         prefix = '_encoded_t'
-        ## overriding the `commit` method
-        if hasattr(object, prefix+'_commit'):
-            object.commit = getattr(object, prefix+'_commit')
-            delattr(object, prefix+'_commit')
+        ## overriding the `commit` method (keeping the original if we've already hooked it)
+        original = object.__dict__.get(prefix+'_commit', None) or object.commit
 
         def commit(**attrs):
             # first cast our object into a block
@@ -1865,13 +1974,11 @@ class encoded_t(wrapper_t):
             # commit it to the encoded_t
             enc.commit(offset=0, source=provider.proxy(self))
             return object
-        setattr(object, prefix+'_commit', object.commit)
+        setattr(object, prefix+'_commit', original)
         object.commit = commit
 
-        ## overloading the `load` method
-        if hasattr(object, prefix+'_load'):
-            object.load = getattr(object, prefix+'_load')
-            delattr(object, prefix+'_load')
+        ## overloading the `load` method (keeping the original if we've already hooked it)
+        original = object.__dict__.get(prefix+'_load', None) or object.load
 
         def load(**attrs):
             # first cast our encoded_t into a block
@@ -1886,7 +1993,7 @@ class encoded_t(wrapper_t):
             # finally load the decoded obj into self
             fn = getattr(object, prefix+'_load')
             return fn(offset=0, source=provider.proxy(dec))
-        setattr(object, prefix+'_load', object.load)
+        setattr(object, prefix+'_load', original)
         object.load = load
 
         # ..and we're done
@@ -1948,6 +2055,9 @@ def setbyteorder(endianness):
         return setbyteorder(config.byteorder.littleendian)
     raise ValueError("Unknown integer endianness {!r}".fromat(endianness))
 
+# precompiled structures for decoding the common pointer sizes keyed by (size,byteorder)
+_pointer_struct = dict(((struct.calcsize(prefix+fmt), order),struct.Struct(prefix+fmt)) for fmt in 'BHIQ' for prefix,order in (('<',config.byteorder.littleendian),('>',config.byteorder.bigendian)))
+
 class pointer_t(encoded_t):
     _object_ = None
 
@@ -1961,17 +2071,30 @@ class pointer_t(encoded_t):
 
         def __setvalue__(self, offset):
             bs = self.blocksize()
-            res = bitmap.new(offset, bs*8)
-            res = bitmap.data(res, reversed=(self.byteorder is config.byteorder.littleendian))
+            offset &= 2**(bs*8)-1
+
+            # use a precompiled structure if there's one for our size
+            res = _pointer_struct.get((bs,self.byteorder))
+            if res is not None:
+                return super(pointer_t._value_,self).__setvalue__(res.pack(offset))
+
+            # otherwise format the integer as big-endian hex so that it can be decoded in one step
+            res = '{:0{:d}x}'.format(offset, bs*2).decode('hex') if bs > 0 else ''
+            res = res[::-1] if self.byteorder is config.byteorder.littleendian else res
             return super(pointer_t._value_,self).__setvalue__(res)
 
         def __getvalue__(self):
             if self.value is None:
                 raise error.InitializationError(self, 'pointer_t._value_.get')
-            bs = self.blocksize()
-            value = reversed(self.value) if self.byteorder is config.byteorder.littleendian else self.value
-            res = reduce(bitmap.push, map(None, map(ord,value), (8,)*len(self.value)), bitmap.zero)
-            return bitmap.value(res)
+
+            # use a precompiled structure if there's one for our size
+            res = _pointer_struct.get((len(self.value),self.byteorder))
+            if res is not None:
+                return res.unpack(self.value)[0]
+
+            # otherwise, convert it from a big-endian hexstring
+            value = self.value[::-1] if self.byteorder is config.byteorder.littleendian else self.value
+            return int(value.encode('hex'), 16) if value else 0
 
     def decode(self, object, **attrs):
         return object.cast(self._value_, **attrs)
@@ -1979,7 +2102,6 @@ class pointer_t(encoded_t):
     def encode(self, object, **attrs):
         return object.cast(self._value_, **attrs)
 
-    @utils.memoize('self', self=lambda n:(n.source, n._object_, n.object.__getvalue__()), attrs=lambda n:tuple(sorted(n.items())))
     def dereference(self, **attrs):
         res = self.decode(self.object)
         attrs.setdefault('__name__', '*'+self.name())
@@ -2003,7 +2125,9 @@ class pointer_t(encoded_t):
     num = number = int
 
     def classname(self):
-        targetname = force(self._object_, self).typename() if istype(self._object_) else getattr(self._object_, '__name__', 'None')
+        # only a pbinary type needs to be forced (into a partial) to get its name
+        t = self._object_
+        targetname = (force(t, self) if pbinary.istype(t) else t).typename() if istype(t) else getattr(t, '__name__', 'None')
         return '{:s}<{:s}>'.format(self.typename(),targetname)
 
     def summary(self, **options):
@@ -2029,7 +2153,8 @@ class rpointer_t(pointer_t):
             basename = baseobject.classname() if isinstance(self._baseobject_, base) else baseobject.__name__
             return '{:s}({:s}, {:s})'.format(self.typename(), self.object.classname(), basename)
 
-        objectname = force(self._object_,self).typename() if istype(self._object_) else self._object_.__name__
+        t = self._object_
+        objectname = (force(t, self) if pbinary.istype(t) else t).typename() if istype(t) else t.__name__
         return '{:s}({:s}, ...)'.format(self.typename(), objectname)
 
     def decode(self, object, **attrs):
@@ -2053,7 +2178,8 @@ class opointer_t(pointer_t):
         calcname = self._calculate_.__name__
         if self.initializedQ():
             return '{:s}({:s}, {:s})'.format(self.typename(), self.object.classname(), calcname)
-        objectname = force(self._object_,self).typename() if istype(self._object_) else self._object_.__name__
+        t = self._object_
+        objectname = (force(t, self) if pbinary.istype(t) else t).typename() if istype(t) else t.__name__
         return '{:s}({:s}, {:s})'.format(self.typename(), objectname, calcname)
 
     def decode(self, object, **attrs):
@@ -2133,6 +2259,7 @@ if __name__ == '__main__':
         return fn
 
 if __name__ == '__main__':
+    import base64,zlib
     import ptypes
     from ptypes import *
 
@@ -2170,12 +2297,13 @@ if __name__ == '__main__':
             _object_ = dynamic.block(len(s))
 
             key = k
+            table = str().join(chr(i^k) for i in xrange(0x100))
 
             def encode(self, object, **attrs):
-                data = ''.join(chr(ord(x)^k) for x in object.serialize())
+                data = object.serialize().translate(self.table)
                 return super(xor,self).encode(ptype.block().set(data))
             def decode(self, object, **attrs):
-                data = ''.join(chr(ord(x)^k) for x in object.serialize())
+                data = object.serialize().translate(self.table)
                 return super(xor,self).decode(ptype.block().set(data))
 
         x = xor(source=ptypes.prov.string(s))
@@ -2196,12 +2324,13 @@ if __name__ == '__main__':
             _object_ = dynamic.block(len(match))
 
             key = k
+            table = str().join(chr(i^k) for i in xrange(0x100))
 
             def encode(self, object, **attrs):
-                data = ''.join(chr(ord(x)^k) for x in object.serialize())
+                data = object.serialize().translate(self.table)
                 return super(xor,self).encode(ptype.block().set(data))
             def decode(self, object, **attrs):
-                data = ''.join(chr(ord(x)^k) for x in object.serialize())
+                data = object.serialize().translate(self.table)
                 return super(xor,self).decode(ptype.block().set(data))
 
         instance = pstr.string(length=len(match)).set(match)
@@ -2213,17 +2342,17 @@ if __name__ == '__main__':
 
     @TestCase
     def test_encoded_b64():
-        s = 'AAAABBBBCCCCDDDD'.encode('base64').strip() + '\x00' + 'A'*20
+        s = base64.b64encode('AAAABBBBCCCCDDDD') + '\x00' + 'A'*20
         class b64(ptype.encoded_t):
             _value_ = pstr.szstring
             _object_ = dynamic.array(pint.uint32_t, 4)
 
             def encode(self, object, **attrs):
-                data = object.serialize().encode('base64')
+                data = base64.b64encode(object.serialize())
                 return super(b64,self).encode(ptype.block().set(data))
 
             def decode(self, object, **attrs):
-                data = object.serialize().decode('base64')
+                data = base64.b64decode(object.serialize())
                 return super(b64,self).decode(ptype.block().set(data))
 
         x = b64(source=ptypes.prov.string(s)).l
@@ -2234,18 +2363,18 @@ if __name__ == '__main__':
     @TestCase
     def test_decoded_b64():
         input = 'AAAABBBBCCCCDDDD\x00'
-        result = 'AAAABBBBCCCCDDDD\x00'.encode('base64')
+        result = base64.b64encode('AAAABBBBCCCCDDDD\x00')
 
         class b64(ptype.encoded_t):
             _value_ = dynamic.block(len(result))
             _object_ = dynamic.array(pint.uint32_t, 4)
 
             def encode(self, object, **attrs):
-                data = object.serialize().encode('base64')
+                data = base64.b64encode(object.serialize())
                 return super(b64,self).encode(ptype.block().set(data))
 
             def decode(self, object, **attrs):
-                data = object.serialize().decode('base64')
+                data = base64.b64decode(object.serialize())
                 return super(b64,self).decode(ptype.block().set(data))
 
         instance = pstr.szstring().set(input)
@@ -2543,7 +2672,7 @@ if __name__ == '__main__':
     @TestCase
     def test_type_getoffset():
         class bah(ptype.type): length=2
-        data = prov.string(map(chr,xrange(ord('a'),ord('z'))))
+        data = prov.string('abcdefghijklmnopqrstuvwxy')
         a = bah(offset=0,source=data)
         if a.getoffset() == 0 and a.l.serialize()=='ab':
             raise Success
@@ -2551,7 +2680,7 @@ if __name__ == '__main__':
     @TestCase
     def test_type_setoffset():
         class bah(ptype.type): length=2
-        data = prov.string(map(chr,xrange(ord('a'),ord('z'))))
+        data = prov.string('abcdefghijklmnopqrstuvwxy')
         a = bah(offset=0,source=data)
         a.setoffset(20)
         if a.l.initializedQ() and a.getoffset() == 20 and a.serialize() == 'uv':
@@ -2597,10 +2726,10 @@ if __name__ == '__main__':
             class _zlibblock(ptype.encoded_t):
                 _object_ = ptype.block
                 def encode(self, object, **attrs):
-                    data = object.serialize().encode('zlib')
+                    data = zlib.compress(object.serialize())
                     return super(cblock._zlibblock,self).encode(ptype.block().set(data), length=len(data))
                 def decode(self, object, **attrs):
-                    data = object.serialize().decode('zlib')
+                    data = zlib.decompress(object.serialize())
                     return super(cblock._zlibblock,self).decode(ptype.block().set(data), length=len(data))
 
             def __zlibblock(self):
@@ -2611,7 +2740,7 @@ if __name__ == '__main__':
                 (__zlibblock, 'data'),
             ]
         message = 'hi there.'
-        cmessage = message.encode('zlib')
+        cmessage = zlib.compress(message)
         data = pint.uint32_t().set(len(cmessage)).serialize()+cmessage
         a = cblock(source=prov.string(data)).l
         if a['data'].d.l.serialize() == message:
@@ -2623,10 +2752,10 @@ if __name__ == '__main__':
         class zlibblock(ptype.encoded_t):
             _object_ = ptype.block
             def encode(self, object, **attrs):
-                data = object.serialize().encode('zlib')
+                data = zlib.compress(object.serialize())
                 return super(zlibblock,self).encode(ptype.block().set(data))
             def decode(self, object, **attrs):
-                data = object.serialize().decode('zlib')
+                data = zlib.decompress(object.serialize())
                 return super(zlibblock,self).decode(ptype.block().set(data))
 
         class mymessage(ptype.block): pass
@@ -2720,7 +2849,7 @@ if __name__ == '__main__':
 
         result = dict(y.compare(z))
         if result.keys() == [1]:
-            s,o = tuple(reduce(lambda a,b:a+b,map(lambda x:x.serialize(),X),'') for X in result[1])
+            s,o = tuple(str().join(x.serialize() for x in X) for X in result[1])
             if s == g.serialize() and o == ''.join(map(chr,(40,60,80,100))):
                 raise Success
 
@@ -2747,7 +2876,7 @@ if __name__ == '__main__':
         result = dict(y.compare(z))
         if result.keys() == [3]:
             s,o = result[3]
-            if s is None and reduce(lambda a,b:a+b,map(lambda x:x.serialize(),o),'') == g.serialize()+'\x40':
+            if s is None and str().join(x.serialize() for x in o) == g.serialize()+'\x40':
                 raise Success
     @TestCase
     def test_container_set_uninitialized_type():
@@ -1,15 +1,20 @@
 import sys,itertools,_random,math,_weakref,array,logging
-import functools,random
+import functools,operator,random
 
 ## string formatting
 def strdup(string, terminator='\x00'):
     """Will return a copy of ``string`` with the provided ``terminated`` characters trimmed"""
+    if isinstance(string, basestring):
+        res = [index for index in map(string.find, terminator) if index >= 0]
+        return string[:min(res)] if res else string
     count = len(list(itertools.takewhile(lambda n: n not in terminator, string)))
     return string[:count]
 
 def indent(string, tabsize=4, char=' ', newline='\n'):
     """Indent each line of ``string`` with the specified tabsize"""
     indent = char*tabsize
+    if newline:
+        return indent + string.replace(newline, newline + indent)
     strings = [(indent + x) for x in string.split(newline)]
     return newline.join(strings)
 
@@ -22,7 +27,14 @@ class assign(object):
 
     def __enter__(self):
         objects,attrs = self.objects,self.attributes
-        self.states = tuple( dict((k,getattr(o,k)) for k in attrs.keys()) for o in objects)
+
+        # fetch the current values of every attribute from each object in one call
+        keys = attrs.keys()
+        if len(keys) > 1:
+            getter = operator.attrgetter(*keys)
+            self.states = tuple( dict(zip(keys, getter(o))) for o in objects)
+        else:
+            self.states = tuple( dict((k,getattr(o,k)) for k in keys) for o in objects)
         [o.__update__(attrs) for o in objects]
         return objects
 
@@ -33,9 +45,28 @@ class assign(object):
 ## ptype padding types
 class padding:
     """Used for providing padding."""
+    class repeat(object):
+        """An iterator that cycles through the characters of a string"""
+        def __init__(self, value):
+            self.value,self.index = value,0
+        def __iter__(self):
+            return self
+        def next(self):
+            res = self.value[self.index]
+            self.index = (self.index + 1) % len(self.value)
+            return res
+        def take(self, amount):
+            """Return the next ``amount`` characters as a string"""
+            value = self.value[self.index:] + self.value[:self.index]
+            count,extra = divmod(amount, len(value))
+            self.index = (self.index + amount) % len(value)
+            return value*count + value[:extra]
+
     class source:
         @classmethod
         def repeat(cls,value):
+            if isinstance(value, basestring) and len(value) > 0:
+                return padding.repeat(value)
             return itertools.cycle(iter(value))
 
         @classmethod
@@ -43,8 +74,9 @@ class padding:
             return (x for x in iter(iterable))
 
         @classmethod
-        def file(cls,file):
-            return itertools.imap(file.read, itertools.repeat(1))
+        def file(cls,file,size=0x1000):
+            # read the file a block at a time and stop once it has been exhausted
+            return itertools.chain.from_iterable(iter(functools.partial(file.read, size), ''))
             #return (file.read(1) for x in itertools.count())
 
         @classmethod
@@ -60,6 +92,8 @@ class padding:
     @classmethod
     def fill(cls, amount, source):
         """Returns a bytearray of ``amount`` elements, from the specified ``source``"""
+        if isinstance(source, cls.repeat):
+            return source.take(amount)
         return str().join(itertools.islice(source, amount))
 
 ## exception remapping
@@ -80,18 +114,39 @@ def mapexception(map={}, any=None, ignored=()):
     if any is not None:
         assert issubclass(any,BaseException), '/any/ expected to be a solitary exception'
 
+    # flatten each source into a lookup table of exception types. the first
+    # source that matched during iteration still wins, so setdefault is used.
+    table, others = {}, []
+    for src,dst in map.iteritems():
+        if isinstance(src, (tuple,list,set,frozenset)):
+            [table.setdefault(t, dst) for t in src]
+        elif hasattr(src,'__contains__'):
+            others.append((src,dst))
+        else:
+            table.setdefault(src, dst)
+        continue
+
     def decorator(fn):
         def decorated(*args, **kwds):
             try:
                 return fn(*args, **kwds)
-            except:
+            except BaseException, v:
+                t = v.__class__
+            except:     # old-style classes
                 t,v,_ = sys.exc_info()
 
-            for src,dst in map.iteritems():
-                if t is src or (hasattr(src,'__contains__') and t in src):
+            dst = table.get(t, None)
+            if dst is not None:
+                raise dst(t, *v)
+            for src,dst in others:
+                if t is src or t in src:
                     raise dst(t, *v)
                 continue
-            raise v if t in ignored or any is None else any(t, *v)
+
+            # re-raise the original exception so that its traceback is kept
+            if t in ignored or any is None:
+                raise
+            raise any(t, *v)
 
         functools.update_wrapper(decorated, fn)
         return decorated
@@ -103,6 +158,7 @@ def repr_class(name):
     return "<class {:s}>".format(name)
 def repr_instance(classname, name):
     return "<instance {:s} '{:s}'>".format(classname, name)
+_repr_position_format = {}   # decimal position formats keyed by their precision
 def repr_position(pos, hex=True, precision=0):
     if len(pos) == 1:
         ofs, = pos
@@ -112,16 +168,22 @@ def repr_position(pos, hex=True, precision=0):
         partial = bofs / 8.0
         if hex:
             return '{:x}.{:x}'.format(ofs,math.trunc(partial*0x10))
-        fraction = ':0{:d}d'.format(precision)
-        res = '{:x}.{'+fraction+'}'
+        res = _repr_position_format.get(precision)
+        if res is None:
+            fraction = ':0{:d}d'.format(precision)
+            res = _repr_position_format[precision] = '{:x}.{'+fraction+'}'
         return res.format(ofs,math.trunc(partial * 10**precision))
     return '{:x}.{:x}'.format(ofs,bofs)
 
 ## hexdumping capability
+_printable_table = str().join(chr(n) if n >= 0x20 and n < 0x7f else '.' for n in xrange(0x100))
 def printable(s):
     """Return a string of only printable characters"""
-    return reduce(lambda t,c: t + (c if ord(c) >= 0x20 and ord(c) < 0x7f else '.'), iter(s), '')
+    if isinstance(s, str):
+        return s.translate(_printable_table)
+    return str().join(c if ord(c) >= 0x20 and ord(c) < 0x7f else '.' for c in iter(s))
 
+_hexrow_table = tuple('{:02x}'.format(n) for n in xrange(0x100))
 def hexrow(value, offset=0, width=16, breaks=[8]):
     """Returns ``value as a formatted hexadecimal str"""
     value = str(value)[:width]
@@ -131,9 +193,9 @@ def hexrow(value, offset=0, width=16, breaks=[8]):
     left = '{:04x}'.format(offset)
 
     ## middle
-    res = [ '{:02x}'.format(ord(x)) for x in value ]
+    res = [ _hexrow_table[ord(x)] for x in value ]
     if len(value) < width:
-        res += ['  ' for x in range(extra)]
+        res += ['  '] * extra
 
     for x in breaks:
         if x < len(res):
@@ -154,23 +216,19 @@ def hexdump(value, offset=0, width=16, rows=None, **kwds):
     """
 
     rows = kwds.pop('rows', kwds.pop('lines', None))
-    value = iter(value)
-
-    getRow = lambda o: hexrow(data, offset=o, **kwds)
 
-    res = []
-    (ofs, data) = offset, str().join(itertools.islice(value, width))
-    for i in (itertools.count(1) if rows is None else xrange(1, rows)):
-        res.append( getRow(ofs) )
-        ofs, data = (ofs + width, str().join(itertools.islice(value, width)))
-        if len(data) < width:
-            break
-        continue
+    # collect everything that will be displayed into a single string so that
+    # each row can be sliced directly out of it
+    if not isinstance(value, basestring):
+        value = str().join(value if rows is None else itertools.islice(value, width * max(rows, 1)))
+    size = len(value) if rows is None else min(len(value), width * max(rows, 1))
 
-    if len(data) > 0:
-        res.append( getRow(ofs) )
-    return '\n'.join(res)
+    # an empty value is still displayed as a single (empty) row
+    if size == 0:
+        return hexrow(value, offset=offset, **kwds) if rows is None or rows > 1 else ''
+    return '\n'.join(hexrow(value[o:o+width], offset=offset+o, **kwds) for o in xrange(0, size, width))
 
+_emit_repr_table = tuple('\\x{:02x}'.format(n) for n in xrange(0x100))
 def emit_repr(data, width=0, message=' .. skipped {leftover} chars .. ', padding=' ', **formats):
     """Return a string replaced with ``message`` if larger than ``width``
 
@@ -187,7 +245,7 @@ def emit_repr(data, width=0, message=' .. skipped {leftover} chars .. ', padding
     bytewidth = width / charwidth
     leftover = size - bytewidth
 
-    hexify = lambda s: ''.join('\\x{:02x}'.format(ord(x)) for x in iter(s))
+    hexify = lambda s: str().join(map(_emit_repr_table.__getitem__, map(ord, s))) if isinstance(s, str) else str().join('\\x{:02x}'.format(ord(x)) for x in iter(s))
 
     if width <= 0 or bytewidth >= len(data):
         return hexify(data)
@@ -292,12 +350,25 @@ def memoize(*kargs,**kattrs):
             a,k = c_var
             if a is not None: p[a] = tuple(res)
             if k is not None: p[k] = dict(kwds)
-            k1 = (p.get(k, None) for k in kargs)
-            k2 = ((n(p[o]) if callable(n) else getattr(p[o],n,None)) for o,n in c_attribute)
-            return tuple(itertools.chain(k1, (None,), k2))
-        def callee(*args, **kwds):
-            res = key(*args, **kwds)
-            return cache[res] if res in cache else cache.setdefault(res, fn(*args,**kwds))
+            k1 = tuple(map(p.get, kargs))
+            k2 = tuple([(n(p[o]) if callable(n) else getattr(p[o],n,None)) for o,n in c_attribute])
+            return k1 + (None,) + k2
+        # a result can be anything, so a miss is distinguished by this object
+        missing = object()
+
+        # when keyed by exactly the positional arguments, a call that provides all
+        # of them positionally can use its argument tuple to build the key.
+        count = len(c_positional)
+        if not c_attribute and c_var == (None,None) and list(kargs) == list(c_positional):
+            def callee(*args, **kwds):
+                res = args + (None,) if not kwds and len(args) == count else key(*args, **kwds)
+                value = cache.get(res, missing)
+                return cache.setdefault(res, fn(*args,**kwds)) if value is missing else value
+        else:
+            def callee(*args, **kwds):
+                res = key(*args, **kwds)
+                value = cache.get(res, missing)
+                return cache.setdefault(res, fn(*args,**kwds)) if value is missing else value
 
         # set some utilies on the memoized function
         callee.memoize_key = lambda: key
@@ -448,6 +519,20 @@ if __name__ == '__main__':
         if res == 35 and blah.counter == 2:
             raise Success
 
+    @TestCase
+    def test_memoize_fn_4():
+        @utils.memoize
+        def blah(arg1,arg2):
+            blah.counter += 1
+            return arg1+arg2
+        blah.counter = 0
+        blah(15,20)
+        blah(15,arg2=20)
+        blah(arg1=15,arg2=20)
+        res = blah(20,15)
+        if res == 35 and blah.counter == 2 and len(blah.memoize_cache()) == 2:
+            raise Success
+
     @TestCase
     def test_memoize_im_1():
         class a(object):
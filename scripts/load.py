@@ -12,7 +12,7 @@ def malloc_his(addr):
 	os.system(s)
 
 modules = lldb.target.get_modules_array()
-s_malloc_zones, = (m.FindSymbol('malloc_zones') for m in lldb.target.get_modules_array() if m.FindSymbol('malloc_zones').name)
+s_malloc_zones, = (s for s in (m.FindSymbol('malloc_zones') for m in modules) if s.name)
 z = macheap.entry(offset=int(s_malloc_zones.addr)).l.d.l
 tiny = "tiny_magazines"
 small = "small_magazines"
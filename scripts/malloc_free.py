@@ -4,7 +4,6 @@ import re
 import lldb 
 from glob import *
 import lldb.macosx.heap as j
-import math
 import struct
 
 '''
@@ -12,7 +11,15 @@ script
 '''
 
 log = "mf.txt"
-file(log, "w+").close()
+logfile = file(log, "w", 1)     # line-buffered so nothing is lost if the debugger dies
+
+# the size that malloc_info reports is found within the first parentheses
+malloc_size = re.compile(r'\(([^)]*)')
+result = lldb.SBCommandReturnObject()
+
+def clean_size(output):
+    m = output and malloc_size.search(output)
+    return m.group(1).translate(None,' ') if m else ''
 
 def cont(frame):
     thread = frame.GetThread()
@@ -35,7 +42,8 @@ def get_register(frame, need):
 def quant(clean):
     qu = ""
     if clean:
-        qu += "SMALL [%d]" % int(math.trunc(math.ceil((float(clean)/512.0)))) if int(clean) > 1008 else "TINY [%d]" % int(math.trunc(math.ceil((float(clean)/16.0))))
+        size = int(clean)   # round up to the number of 512 or 16-byte quanta
+        qu += "SMALL [%d]" % ((size + 511) >> 9) if size > 1008 else "TINY [%d]" % ((size + 15) >> 4)
     return qu
 
 def read_rsp(frame, rsp):
@@ -56,14 +64,12 @@ def set_malloc_after():
     lldb.debugger.HandleCommand(log_cmd)
 
 def malloc_after(a, b, c):
-    x = lldb.SBCommandReturnObject()
-    x.Clear()
+    result.Clear()
     rax, rsp = map(functools.partial(get_register, a), ("rax", "rsp"))
-    j.malloc_info(lldb.debugger, rax, x, globals())
-    clean = x.GetOutput() and x.GetOutput().split('(',2)[1].split(')',2)[0].translate(None,' ')
+    j.malloc_info(lldb.debugger, rax, result, globals())
+    clean = clean_size(result.GetOutput())
     info = "Malloc:[%x] -- %s - %s - %x" % (int(rax,16), clean, quant(clean), read_rsp(a, rsp))
-    with file(log, "a") as x:
-        print >>x, info
+    print >>logfile, info
     cont(a)
 
 def set_free():
@@ -74,19 +80,17 @@ def set_free():
     lldb.debugger.HandleCommand(log_cmd)
 
 def free(a, b, c):
-    x = lldb.SBCommandReturnObject()
-    x.Clear()
+    result.Clear()
     rdi = get_register(a, "rdi")
     rsp = get_register(a, "rsp")
-    j.malloc_info(lldb.debugger, rdi, x, globals())
+    j.malloc_info(lldb.debugger, rdi, result, globals())
     out = int(rdi, 16)
-    clean = x.GetOutput() and x.GetOutput().split('(',2)[1].split(')',2)[0].translate(None,' ')
+    clean = clean_size(result.GetOutput())
     qu = quant(clean)
     
 
     info = "Free:::[%x] -- %s - %s - %x" % (out, clean, qu, read_rsp(a,rsp))
-    with file(log, "a") as x:
-        print >>x, info
+    print >>logfile, info
     cont(a)
 
 def set():